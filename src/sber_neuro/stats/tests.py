@@ -1,6 +1,60 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 from scipy import stats
 
+# Shapiro-Wilk p-values keyed on array contents, most recently used last
+_SHAPIRO_CACHE_SIZE = 256
+_shapiro_cache = OrderedDict()
+_shapiro_cache_lock = threading.Lock()
+
+# Above this size Shapiro-Wilk p-values are unreliable (scipy warns) and the
+# t-test is justified by the central limit theorem, so the check is skipped
+_LARGE_SAMPLE_SIZE = 5000
+
+# Past this size the exact Mann-Whitney distribution, which scipy's 'auto'
+# still picks when the other group has 8 or fewer values, is too costly
+_ASYMPTOTIC_MWU_SIZE = 1000
+
+def _drop_nan(x):
+    """
+    Returns x flattened to 1-D and without NaN values.
+
+    Integer and boolean arrays cannot hold NaN, and clean arrays are returned
+    as-is so the common case avoids allocating a mask and a filtered copy.
+    Other dtypes go through np.isnan, which rejects non-numeric data.
+    """
+    x = x.ravel()
+    if x.dtype.kind in 'biu':
+        return x
+    nan_mask = np.isnan(x)
+    if nan_mask.any():
+        return x[~nan_mask]
+    return x
+
+def _shapiro_pvalue(x):
+    """
+    Returns the Shapiro-Wilk p-value for x, memoized on the array contents.
+
+    compare_groups is typically called in loops over features, often with the
+    same groups; hashing the data is much cheaper than re-running the test.
+    """
+    key = (x.dtype.str, x.shape, hashlib.blake2b(x.tobytes(), digest_size=16).digest())
+    with _shapiro_cache_lock:
+        pvalue = _shapiro_cache.get(key)
+        if pvalue is not None:
+            _shapiro_cache.move_to_end(key)
+            return pvalue
+
+    pvalue = stats.shapiro(x).pvalue
+    with _shapiro_cache_lock:
+        _shapiro_cache[key] = pvalue
+        if len(_shapiro_cache) > _SHAPIRO_CACHE_SIZE:
+            _shapiro_cache.popitem(last=False)
+    return pvalue
+
 def compare_groups(data_a, data_b, method='t-test'):
     """
     Compares two groups of data using statistical tests.
@@ -8,6 +62,8 @@ def compare_groups(data_a, data_b, method='t-test'):
     Automatically checks for normality using the Shapiro-Wilk test.
     - If both groups are normally distributed, uses the independent T-test.
     - If either group is not normally distributed, uses the Mann-Whitney U test.
+    Groups with more than 5000 observations are treated as normal without
+    running Shapiro-Wilk.
 
     Args:
         data_a (array-like): Data for group A.
@@ -26,16 +82,14 @@ def compare_groups(data_a, data_b, method='t-test'):
     b = np.asarray(data_b)
 
     # Remove NaNs if any
-    a = a[~np.isnan(a)]
-    b = b[~np.isnan(b)]
+    a = _drop_nan(a)
+    b = _drop_nan(b)
 
     # Check Normality
     # Shapiro-Wilk test: p < 0.05 implies NOT normal
     try:
-        shapiro_a = stats.shapiro(a)
-        shapiro_b = stats.shapiro(b)
-        is_normal_a = shapiro_a.pvalue >= 0.05
-        is_normal_b = shapiro_b.pvalue >= 0.05
+        is_normal_a = a.size > _LARGE_SAMPLE_SIZE or _shapiro_pvalue(a) >= 0.05
+        is_normal_b = b.size > _LARGE_SAMPLE_SIZE or _shapiro_pvalue(b) >= 0.05
     except ValueError:
         # Fallback if sample size is too small for shapiro or other issues
         # Usually requires N >= 3
@@ -50,7 +104,8 @@ def compare_groups(data_a, data_b, method='t-test'):
         p_value = stat_res.pvalue
     else:
         test_used = "Mann-Whitney U test"
-        stat_res = stats.mannwhitneyu(a, b)
+        mwu_method = 'asymptotic' if max(a.size, b.size) > _ASYMPTOTIC_MWU_SIZE else 'auto'
+        stat_res = stats.mannwhitneyu(a, b, method=mwu_method)
         p_value = stat_res.pvalue
 
     significant = p_value < 0.05
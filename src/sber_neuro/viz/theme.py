@@ -1,56 +1,61 @@
-import plotly.io as pio
-import plotly.graph_objects as go
+# Color Palette
+SBER_COLORS = (
+    "rgb(0, 112, 59)",   # Primary 1
+    "rgb(66, 149, 56)",  # Primary 2
+    "rgb(124, 193, 68)", # Primary 3
+    "rgb(214, 223, 61)", # Secondary 1
+    "rgb(216, 223, 126)" # Secondary 2
+)
+
+BACKGROUND_COLOR = "rgb(252, 252, 249)"
+GRID_COLOR = "rgb(220, 220, 220)" # Subtle gray
+FONT_FAMILY = "Arial"
+FONT_SIZE = 14
 
 def apply_sber_theme():
     """
     Registers and sets the 'sber_corporate' Plotly theme with Sberbank corporate colors.
     """
+    # Plotly is imported lazily so importing this module stays cheap
+    import plotly.io as pio
+    import plotly.graph_objects as go
 
-    # Color Palette
-    colors = [
-        "rgb(0, 112, 59)",   # Primary 1
-        "rgb(66, 149, 56)",  # Primary 2
-        "rgb(124, 193, 68)", # Primary 3
-        "rgb(214, 223, 61)", # Secondary 1
-        "rgb(216, 223, 126)" # Secondary 2
-    ]
-
-    background_color = "rgb(252, 252, 249)"
-    grid_color = "rgb(220, 220, 220)" # Subtle gray
-    font_family = "Arial"
-    font_size = 14
+    # The template only needs to be built once per process
+    if "sber_corporate" in pio.templates:
+        pio.templates.default = "sber_corporate"
+        return
 
     # Define the template
     sber_template = go.layout.Template(
         layout=go.Layout(
             # Backgrounds
-            paper_bgcolor=background_color,
-            plot_bgcolor=background_color,
+            paper_bgcolor=BACKGROUND_COLOR,
+            plot_bgcolor=BACKGROUND_COLOR,
 
             # Fonts
             font=dict(
-                family=font_family,
-                size=font_size
+                family=FONT_FAMILY,
+                size=FONT_SIZE
             ),
 
             # Colorway (for sequential colors in plots)
-            colorway=colors,
+            colorway=SBER_COLORS,
 
             # Axes
             xaxis=dict(
-                gridcolor=grid_color,
-                zerolinecolor=grid_color,
+                gridcolor=GRID_COLOR,
+                zerolinecolor=GRID_COLOR,
             ),
             yaxis=dict(
-                gridcolor=grid_color,
-                zerolinecolor=grid_color,
+                gridcolor=GRID_COLOR,
+                zerolinecolor=GRID_COLOR,
             ),
 
             # Title
             title=dict(
                 font=dict(
-                    family=font_family,
-                    size=font_size + 4 # Slightly larger for title
+                    family=FONT_FAMILY,
+                    size=FONT_SIZE + 4 # Slightly larger for title
                 )
             )
         )